@@ -0,0 +1,15 @@
+"""
+setup.py
+Builds the optional _signer C extension used by basic_bot.py for request signing.
+
+    python setup.py build_ext --inplace
+
+basic_bot.py falls back to the pure-Python signer when _signer is not built.
+"""
+
+from setuptools import Extension, setup
+
+setup(
+    name="basicbot-signer",
+    ext_modules=[Extension("_signer", ["_signer.c"], libraries=["crypto"])],
+)